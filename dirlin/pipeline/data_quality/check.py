@@ -1,13 +1,64 @@
 import inspect
+import warnings
+from itertools import repeat
 from typing import Callable, Any, TypeVar
+from weakref import WeakKeyDictionary
+
+import numpy as np
+import pandas as pd
+
+
+_CHECK_METADATA_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+"""`check_function`: {option keywords: (annotations, parameter names, expected arguments, positional parameter names)},
+shared by every Check made from the same function, which each copy the dicts and lists they keep.
+Weak keys so the cache doesn't keep user functions alive"""
+
+
+def _get_cached_metadata(check_function: Callable[..., Any], option_keywords: frozenset[str]) -> tuple | None:
+    """returns the cached introspection of the check function, or None if it hasn't been cached"""
+    try:
+        return _CHECK_METADATA_CACHE.get(check_function, {}).get(option_keywords)
+    except TypeError:  # the function can't be weakly referenced (or hashed), so it's never cached
+        return None
+
+
+def _set_cached_metadata(check_function: Callable[..., Any], option_keywords: frozenset[str], metadata: tuple):
+    """stores the introspection of the check function for the next Check made from it"""
+    try:
+        _CHECK_METADATA_CACHE.setdefault(check_function, {})[option_keywords] = metadata
+    except TypeError:
+        pass
 
 class Check:
+    __slots__ = (
+        '_check_function', 'fix_function', 'name', 'jit', 'vectorize', '_compiled_function', '_compile_failed',
+        '_runs_on_series', '_arg_option_signature', '_function_annotations', '_param_signatures',
+        '_class_signature', '_positional_parameters', 'expected_arguments', 'takes_series', 'takes_arrays',
+        '__weakref__',
+    )
+    """fixed attributes, so Checks don't carry an instance `__dict__` and attribute reads in `run()` stay cheap"""
+
+    _CLASS_PARAMS = frozenset(('self', 'cls'))
+    """Represents the arguments used for class functions or instantiated object functions"""
+
+    _DEFAULT_OPTION_KEYWORDS = frozenset(("option",))
+    """option keywords of the default `option_keywords="option"`, shared by every Check that uses the default"""
+
+    _OPTION_KEYWORD_CONVERTERS = {
+        str: lambda keyword: (keyword,),
+        list: tuple,
+        type(None): lambda _: (),
+    }
+    """`type(option_keywords)`: function that turns it into a tuple of keywords, so one dict lookup picks the branch"""
+
     def __init__(
             self,
             check_function: Callable[..., ...],
             *,
             fix_function: Callable[..., Any] | None = None,
-            option_keywords: list[str] | str = "option"
+            option_keywords: list[str] | str = "option",
+            jit: bool = False,
+            vectorize: bool = False
     ):
         ############################
         # HANDLING THE FUNCTION
@@ -25,58 +76,214 @@ class Check:
         self.name: str = self._check_function.__name__
         """name of the function"""
 
+        self.jit: bool = jit
+        """whether to compile scalar checks with `numba.vectorize` and run them over whole columns at once"""
+
+        self.vectorize: bool = vectorize
+        """whether to try giving a scalar check whole columns (pd.Series) at once, before running it row by row"""
+
+        self._compiled_function: Callable[..., Any] | None = None
+        """the numba compiled check function. Compiled on the first `run_compiled()`"""
+
+        self._compile_failed: bool = False
+        """set to True once the check couldn't be compiled, so it isn't attempted again"""
+
+        self._runs_on_series: bool | None = None
+        """whether a scalar check also works when given whole columns. None until `run_vectorized()` tries it"""
+
         # ==== parameter level info ====
         # The mapping needs to have a set or dict that I can quickly reference multiple times
         # - parameter dictionaries could be built off this by using the keys
-        self.__annotations__: dict[str, Any] = inspect.get_annotations(self._check_function)
-        """all parameters of the function. `param`: `Type(arg)`, key-value pair"""
+
+        # option signatures ('option', user input)
+        self._arg_option_signature: frozenset[str] = (
+            self._DEFAULT_OPTION_KEYWORDS if option_keywords == "option"
+            else frozenset(self._handle_string_to_list_conversion(option_keywords))
+        )
+        """defaults to `option`. Marks params with option as a prefix. Denotes params not tied to specific fields.
+        A frozenset, so the `param not in` tests while reading the signature are a single hash lookup"""
+
+        # the same function is often wrapped by many checks, so the introspection is only done once per function
+        _metadata = _get_cached_metadata(self._check_function, self._arg_option_signature)
+        if _metadata is None:
+            _metadata = self._inspect_check_function()
+            _set_cached_metadata(self._check_function, self._arg_option_signature, _metadata)
+        _annotations, _param_signatures, _expected_arguments, _positional_parameters = _metadata
+        # each Check gets its own copies, so changing one Check's metadata doesn't change the cached metadata
+
+        self._function_annotations: dict[str, Any] = dict(_annotations)
+        """all parameters of the function. `param`: `Type(arg)`, key-value pair. Read as `check.__annotations__`"""
 
         # used for quick parameter name checks and class signatures
-        self._param_signatures = list(inspect.signature(self._check_function).parameters)
+        self._param_signatures: list[str] = list(_param_signatures)
         """similar to __annotations__ but discloses only name and use of self or cls as an argument (param instance)"""
 
-        # option signatures ('option', user input)
-        self._arg_option_signature: list = self._handle_string_to_list_conversion(option_keywords)
-        """defaults to `option`. Marks params with option as a prefix. Denotes params not tied to specific fields."""
+        self._class_signature: str | None = (
+            self._handle_class_signatures() if self._param_signatures else None
+        )
+        """the class argument (self, cls) the function takes first, or None"""
+
+        self._positional_parameters: tuple[str, ...] | None = _positional_parameters
+        """parameter names (after any class argument) in the order the function takes them, or None if
+        one of them can't be passed by position. Used by `run_per_row()` to skip building kwargs per row"""
 
         # ==== API level info ====
         # this section is for what the check needs to request or respond with to other requests
         # - For example, we need to know what parameters we are expecting from outside sources
-        self.expected_arguments: dict[str, Any] = {
-            param: ptype for param, ptype in self.__annotations__.items()
-            if param not in self._arg_option_signature and param != "return"
-        }
+        self.expected_arguments: dict[str, Any] = dict(_expected_arguments)
         """returns the expected parameters of the check function
 
         For example, if a function has the parameters `def function(arg1, arg2, arg3)`,
         the function will return a dictionary of `{arg1: type(arg1), arg2: type(arg2), arg3: type(arg3)}`.
         """
 
-        # i) we need to add some checks now since `inspect.get_annotations` does not return
-        # a proper dictionary with all parameters unless it's been typed. I think we force
-        # the user to type their functions to make it clean
-        _function_signature_check = [
-            sig for sig in inspect.signature(self._check_function).parameters.keys()
-            if sig not in self._arg_option_signature and sig not in ('self', 'cls')
-        ]
-        if len(self.expected_arguments) != len(_function_signature_check):
-            raise IndexError(
-                f"One or more parameters are not type in the function `{self._check_function.__name__}`."
-                f" Please add the proper typing to your function parameters."
-            )
+        self.takes_series: bool = pd.Series in self.expected_arguments.values()
+        """whether the check takes whole columns (`pd.Series`) instead of a single value per row"""
+
+        self.takes_arrays: bool = not self.takes_series and np.ndarray in self.expected_arguments.values()
+        """whether the check takes whole columns as numpy arrays (`np.ndarray`), without the pd.Series index"""
+
+    def __getattr__(self, name: str) -> Any:
+        """keeps `check.__annotations__` returning the function's annotations. Only called for attributes that
+        aren't found, so `Check` itself keeps the class annotations `typing.get_type_hints()` expects"""
+        if name == "__annotations__":
+            return self._function_annotations
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def run(self, **kwargs) -> Any:
         """API that wraps around the `_check_function` so that we can  deal with things like
         signatures within the Check class since it abstracts it out of the Validation class.
 
-        Uses `_handle_class_signatures()` to handle class signatures`. Returns whatever the
-        check_function would have returned.
+        Uses the class signature found by `_handle_class_signatures()` at init to handle class signatures.
+        Returns whatever the check_function would have returned.
         """
-        _has_class_signature = self._handle_class_signatures()
-
-        if not _has_class_signature:
+        if self._class_signature is None:
             return self._check_function(**kwargs)
-        return self._check_function(_has_class_signature, **kwargs)
+        return self._check_function(self._class_signature, **kwargs)
+
+    def run_per_row(self, **kwargs) -> list:
+        """runs the check once per row, with each keyword argument being the column (array) of values for
+        that parameter. Returns the list of results, one per row.
+
+        When the columns are exactly the function's parameters, the function is mapped over the columns
+        by position. Otherwise, each row is passed as keyword arguments.
+        """
+        _positional = self._positional_parameters
+        if _positional and len(kwargs) == len(_positional) and all(param in kwargs for param in _positional):
+            columns = [kwargs[param] for param in _positional]
+            if self._class_signature is None:
+                return list(map(self._check_function, *columns))
+            return list(map(self._check_function, repeat(self._class_signature), *columns))
+
+        parameters = list(kwargs.keys())
+        return [self.run(**dict(zip(parameters, row))) for row in zip(*kwargs.values())]
+
+    def run_compiled(self, **kwargs) -> Any:
+        """runs the check over whole columns (numpy arrays) at once with a `numba.vectorize` compiled
+        version of the check function.
+
+        Only used when the Check was created with `jit=True`. Returns None if the check can't be compiled
+        (numba isn't installed, the function has a class signature, or numba can't type the function or
+        the columns), or if the columns aren't every parameter of the function (options left to their
+        defaults), so that the caller can fall back to running the check row by row.
+        """
+        if not self.jit or self._compile_failed:
+            return None
+        _positional = self._positional_parameters
+        if _positional is None or len(kwargs) != len(_positional) or any(param not in kwargs for param in _positional):
+            # options left to their defaults can't be given to the compiled ufunc, which needs every argument
+            return None
+        try:
+            if self._compiled_function is None:
+                if self._class_signature is not None:
+                    raise TypeError("checks with class signatures can't be compiled")
+                import numba
+
+                self._compiled_function = numba.vectorize(self._check_function)
+            return self._compiled_function(*(kwargs[param] for param in _positional))
+        except Exception as e:
+            reason = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+            warnings.warn(f"Could not compile `{self.name}` with numba, running it row by row instead: {reason}")
+            self._compile_failed = True
+            return None
+
+    def run_vectorized(self, **kwargs) -> pd.Series | None:
+        """runs a scalar check once with whole columns (pd.Series) as the arguments.
+
+        Checks like `return high >= low` work the same on a Series as on a single value. Returns None if
+        the check doesn't (it raises, or it doesn't return a Series on the same index as the columns), so that
+        the caller can fall back to running the check row by row. The outcome is remembered, so checks
+        that only work on single values are not tried again.
+
+        Only used when the Check was created with `vectorize=True`, since a check that works on single values
+        can also raise or give a different answer on a Series (`and`, `if`, ...).
+        """
+        if not self.vectorize or self._runs_on_series is False:
+            return None
+        try:
+            results = self.run(**kwargs)
+        except Exception:
+            results = None
+        # results on another index (a reset one, a sorted one) would be matched to the wrong rows
+        expected_index = next(iter(kwargs.values())).index if kwargs else None
+        self._runs_on_series = isinstance(results, pd.Series) and results.index.equals(expected_index)
+        if not self._runs_on_series:
+            return None
+        return results
+
+    def _inspect_check_function(
+            self
+    ) -> tuple[dict[str, Any], list[str], dict[str, Any], tuple[str, ...] | None]:
+        """reads the annotations, parameter names and expected arguments off the check function
+
+        Uses a single `inspect.signature` walk. Raises an IndexError if any of the parameters that
+        need to be given to the check (not an option or class argument) are missing a type hint.
+
+        :return: tuple of (annotations, parameter names, expected arguments, positional parameter names)
+        """
+        # one `inspect.signature` walk is shared by everything below
+        _signature = inspect.signature(self._check_function)
+        # functions from modules using `from __future__ import annotations` have string annotations ('pd.Series'),
+        # so those (and only those) are evaluated into the real types
+        if any(isinstance(parameter.annotation, str) for parameter in _signature.parameters.values()):
+            try:
+                _signature = inspect.signature(self._check_function, eval_str=True)
+            except Exception as e:
+                print(f"Could not resolve the string annotations of `{self.name}`, using them as written: {e}")
+        annotations = {
+            param: parameter.annotation for param, parameter in _signature.parameters.items()
+            if parameter.annotation is not inspect.Parameter.empty
+        }
+        if _signature.return_annotation is not inspect.Signature.empty:
+            annotations["return"] = _signature.return_annotation
+        param_signatures = list(_signature.parameters)
+        # the class argument (self, cls) can only be the first parameter, so it's dropped once up front
+        _parameters = list(_signature.parameters.values())
+        if _parameters and _parameters[0].name in self._CLASS_PARAMS:
+            _parameters = _parameters[1:]
+        expected_arguments = {
+            param: ptype for param, ptype in annotations.items()
+            if param not in self._arg_option_signature and param != "return"
+        }
+
+        # i) we need to add some checks now since `inspect.get_annotations` does not return
+        # a proper dictionary with all parameters unless it's been typed. I think we force
+        # the user to type their functions to make it clean
+        _function_signature_count = sum(
+            1 for parameter in _parameters if parameter.name not in self._arg_option_signature
+        )
+        if len(expected_arguments) != _function_signature_count:
+            raise IndexError(
+                f"One or more parameters are not typed in the function `{self.name}`."
+                f" Please add the proper typing to your function parameters."
+            )
+
+        _positional_kinds = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        positional_parameters = (
+            tuple(parameter.name for parameter in _parameters)
+            if all(parameter.kind in _positional_kinds for parameter in _parameters) else None
+        )
+        return annotations, param_signatures, expected_arguments, positional_parameters
 
     def _handle_class_signatures(self) -> str | None:
         """identifies whether the check function has class arguments (self, cls) as its first argument
@@ -90,35 +297,33 @@ class Check:
         Returns the class argument itself (self, cls) if the function has a class signature, or None
         if there is no class signature in the function.
         """
-        _example_param_instances = ('self', 'cls')
-        """Represents the arguments used for class functions or instantiated object functions"""
-
         if self._param_signatures:
             first_arg = self._param_signatures[0]
-            first_arg_is_class_signature = first_arg in _example_param_instances
+            first_arg_is_class_signature = first_arg in self._CLASS_PARAMS
         else:
             raise KeyError(f"{self.name} has no parameters!")
         if not first_arg_is_class_signature:
             return None
         return first_arg
 
-    def _handle_string_to_list_conversion(self, multi_type_param: str | list[str]) -> list[str] | list:
-        """identifies the argument type, and converts it into a list of string
+    def _handle_string_to_list_conversion(self, multi_type_param: str | list[str]) -> tuple[str, ...]:
+        """identifies the argument type, and converts it into a tuple of string
 
         Specifically used for parameters in the class that requires str types to be converted to lists
         to make it easier to loop through without considering scalar values.
 
-        Returns empty list `[]` if the argument is not given.
+        Returns empty tuple `()` if the argument is not given.
 
         """
+        _converter = self._OPTION_KEYWORD_CONVERTERS.get(type(multi_type_param))
+        if _converter is not None:
+            return _converter(multi_type_param)
+        # subclasses of str or list don't match the exact type lookup above
         if isinstance(multi_type_param, str):
-            return [multi_type_param]
+            return (multi_type_param,)
         elif isinstance(multi_type_param, list):
-            return multi_type_param
-        elif multi_type_param is None:
-            return []
-        else:
-            raise TypeError(f"{self.name} can only handle string or list")
+            return tuple(multi_type_param)
+        raise TypeError(f"{self.name} can only handle string or list")
 
 
 CheckType = TypeVar('CheckType', bound=Check)
@@ -1,10 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import TypeVar, Any
 
+import numpy as np
 import pandas as pd
 
 from dirlin.pipeline.data_quality.check import Check, CheckType
 
 
+_PARAMETER_CACHE_SIZE: int = 8
+"""number of column layouts a Validation keeps the `parameter: column` mappings of"""
+
+
 class Validation:
     def __init__(
             self,
@@ -29,8 +35,14 @@ class Validation:
         #####################################
 
         # ==== All ====
+        self._parameter_cache: dict[tuple, dict[Check, tuple[dict[str, str], list[dict[str, str]] | None]]] = dict()
+        """`{(columns, infer_shared): {check: (static args, shared parameter sets)}}` of previous runs.
+        
+        Validating another dataframe with the same columns reuses the `parameter: column` mapping.
+        Keeps the `_PARAMETER_CACHE_SIZE` most recently used column layouts, and is cleared when the checks change.
+        """
+
         self.checks_performed = check  # confirmed
-        """List of all checks to perform for the validation"""
 
         # ==== Used to Create Arguments ====
         self._shared_param_column_map: dict[str, list] = dict()  # confirmed
@@ -65,6 +77,18 @@ class Validation:
         self._param_base_name_map: dict[str, str] | None = None
         """used for finding shared parameters"""
 
+        self._column_cache: dict[str, pd.Series] = dict()
+        """`{column: pd.Series}` of the columns used by the checks in the current `run()`.
+        
+        Each column is pulled out of the dataframe once and shared by every check that uses it.
+        """
+
+        self._column_base_name_map: dict[str | None, list[str]] | None = None
+        """`{base name: list[column]}` of the dataframe columns, used for finding shared parameters.
+        
+        Built once per `run()` and shared by every check.
+        """
+
         self._shared_params: list[str] | list = shared_param if shared_param is not None else list()
         """list of params given by the validation class when it knows which column is a shared param"""
 
@@ -81,18 +105,33 @@ class Validation:
         self.key_column: str | None = None
         """Used to store the key column if one was given"""
 
+    @property
+    def checks_performed(self) -> list[CheckType]:
+        """List of all checks to perform for the validation"""
+        return self._checks_performed
+
+    @checks_performed.setter
+    def checks_performed(self, checks: list[CheckType]) -> None:
+        # the cached `parameter: column` mappings belong to the previous checks
+        self._checks_performed = checks
+        self._parameter_cache.clear()
+
     def run(
             self,
             df: pd.DataFrame,
             *,
             key_column: str | None = None,
             field_mapping: dict[str, str] | None = None,
-            infer_shared: bool = False
+            infer_shared: bool = False,
+            max_workers: int = 1
     ) -> pd.DataFrame:
         """function that handles running the Dataframe and the various checks
 
         Still in the very early stages, but will likely expand to handle different errors and checks
 
+        :param max_workers: number of threads the checks are run on. Defaults to 1, which runs the checks one
+        after another. Checks are independent of each other, so checks on whole columns (numpy and pandas
+        release the GIL) can run side by side. The results keep the order of the checks either way.
         """
         # ===== handling function arguments and flags ====
         if field_mapping is not None:
@@ -104,18 +143,45 @@ class Validation:
         """an index or list of column names in the given dataframe"""
 
         # ==== collection check function data ====
+        self._column_base_name_map = None  # the columns can change between runs
+        self._column_cache = dict()
+        # the layout is moved to the end on every run, so the first one is the least recently used
+        _layout_key = (tuple(_df_columns), self._flag_infer_shared_params)
+        _layout_parameters = self._parameter_cache.pop(_layout_key, None) or dict()
+        self._parameter_cache[_layout_key] = _layout_parameters
+        if len(self._parameter_cache) > _PARAMETER_CACHE_SIZE:
+            del self._parameter_cache[next(iter(self._parameter_cache))]
+
+        _check_parameters = []
         for check in self.checks_performed:
-            # related to ticket #5 keeping this as a property, but resetting on `run()` function
-            self._shared_param_column_map: dict[str, list] = dict()
-
-            self._infer_param_class(check, _df_columns)  # map parameter to columns (creates shared, static params)
-            self._align_parameters(check, df)  # ties the parameter to the columns and runs the checks
+            parameters = _layout_parameters.get(check)
+            if parameters is None:
+                # related to ticket #5 keeping this as a property, but resetting on `run()` function
+                self._shared_param_column_map: dict[str, list] = dict()
+
+                self._infer_param_class(check, _df_columns)  # map parameter to columns (creates shared, static params)
+                parameters = self._map_parameters(check)
+                _layout_parameters[check] = parameters
+            _check_parameters.append((check, parameters))
+
+        # ties the parameter to the columns and runs the checks
+        if max_workers > 1 and len(_check_parameters) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                check_results = list(executor.map(
+                    lambda check_parameters: self._align_parameters(
+                        check_parameters[0], df, *check_parameters[1]
+                    ), _check_parameters
+                ))
+        else:
+            check_results = [self._align_parameters(check, df, *parameters) for check, parameters in _check_parameters]
+        for result in check_results:
+            self.results |= result
 
         # ==== Creating Final Deliverable from Run ====
         if key_column is not None:
             self.key_column = key_column
             temp_key_dict = {key_column: df[key_column]}
-            self.results = self.results | temp_key_dict
+            self.results |= temp_key_dict
         temp_df = pd.DataFrame.from_dict(self.results)
         self.flag_run_processed = True
         return temp_df
@@ -142,15 +208,19 @@ class Validation:
         """
         self._confirm_run_was_ran()
 
-        error_log = dict()
+        _checks, _total_validated, _errors = [], [], []
         for check, result in self.results.items():
-            _error_count = len(result) - sum(result)
-            _total_validated = len(result)
-            error_log[check] = [_total_validated, _error_count]
-
-        error_log_df = pd.DataFrame.from_dict(error_log, orient='index')
-        error_log_df.columns = ['total_checked', 'errors']
-        error_log_df.index.names = ['check']
+            # boolean results are counted with numpy, other results are summed
+            _values = np.asarray(result)
+            _passed = np.count_nonzero(_values) if _values.dtype == bool else sum(result)
+            _checks.append(check)
+            _total_validated.append(len(_values))
+            _errors.append(len(_values) - _passed)
+
+        error_log_df = pd.DataFrame(
+            {'total_checked': _total_validated, 'errors': _errors},
+            index=pd.Index(_checks, name='check'),
+        )
         return error_log_df
 
     def generate_fix_file(self):
@@ -181,9 +251,6 @@ class Validation:
         _found_shared_param = None
         """used for checking if a column is a shared parameter column"""
 
-        _column_base_name_map: dict[str, str] = dict()
-        """used for finding shared parameters"""
-
         if self._shared_params:
             _found_shared_param = any((p in self._shared_params for p in check.expected_arguments))
 
@@ -191,9 +258,11 @@ class Validation:
             if self._param_base_name_map is None:
                 self._param_base_name_map = dict()
 
-            for column in columns:
-                base_name = self._generate_base_name(column)
-                _column_base_name_map[column] = base_name
+            if self._column_base_name_map is None:
+                self._column_base_name_map = dict()
+                for column in columns:
+                    base_name = self._generate_base_name(column)
+                    self._column_base_name_map.setdefault(base_name, []).append(column)
 
             for arg in check.expected_arguments:
                 if arg in self._shared_params or self._flag_infer_shared_params:
@@ -212,15 +281,14 @@ class Validation:
                         self._arg_map[param] = param
                 case False:  # is a shared parameter field / 2024.12.26 or an Options parameter
                     if self._flag_infer_shared_params or param in self._shared_params:
-                        for column in columns:
-                            # parameter nfl_qb matches column raiders_qb (qb == qb)
-                            if _column_base_name_map[column] == self._param_base_name_map[param]:
-                                if param not in self._shared_param_column_map:
-                                    self._shared_param_column_map[param] = list()
-                                    if not _found_shared_param:
-                                        _found_shared_param = True
-                                if column not in self._shared_param_column_map[param]:
-                                    self._shared_param_column_map[param].append(column)
+                        # parameter nfl_qb matches column raiders_qb (qb == qb)
+                        for column in self._column_base_name_map.get(self._param_base_name_map[param], []):
+                            if param not in self._shared_param_column_map:
+                                self._shared_param_column_map[param] = list()
+                                if not _found_shared_param:
+                                    _found_shared_param = True
+                            if column not in self._shared_param_column_map[param]:
+                                self._shared_param_column_map[param].append(column)
                     elif str(param).startswith('option_'):
                         self._option_map[param] = param # need to figure out how to handle these
                     else:
@@ -295,10 +363,12 @@ class Validation:
                 if parameter in self._shared_param_column_map:
                     del self._shared_param_column_map[parameter]
 
-    def _align_parameters(self, check: Check, df: pd.DataFrame):
-        """Ties the `parameter: column` mapping (self.arg_map + self.shared_param_column_map) and runs the checks
-        on the pd.Series by aligning the parameter to the pd.Series argument
+    def _map_parameters(self, check: Check) -> tuple[dict[str, str], list[dict[str, str]] | None]:
+        """Ties the `parameter: column` mapping (self.arg_map + self.shared_param_column_map) together
+        into the arguments of the check
 
+        Returns the static `{parameter: column}` arguments, and the list of `{parameter: column}` argument sets
+        for each group of shared columns (None if the check has no shared parameters).
         """
         # ==== creates the 'parameter: column' mapping ====
         static_args = {kw: self._arg_map[kw] for kw in check.expected_arguments if kw in self._arg_map}
@@ -312,39 +382,109 @@ class Validation:
         # We do this by splitting the shared args into different combinations
         shared_param_combos = [dict(zip(shared_args.keys(), values)) for values in zip(*shared_args.values())]
         combined_parameter_sets = [shared_combo | static_args for shared_combo in shared_param_combos]
+        if not shared_args:
+            return static_args, None
+        return static_args, combined_parameter_sets
+
+    def _align_parameters(
+            self,
+            check: Check,
+            df: pd.DataFrame,
+            static_args: dict[str, str],
+            combined_parameter_sets: list[dict[str, str]] | None
+    ) -> dict[str, pd.Series]:
+        """runs the checks on the pd.Series by aligning the parameter to the pd.Series argument
 
+        :return: `{check name: results}` of the check, one item per parameter set the check was run with
+        """
         result = {}
-        if shared_args:
+        check_name = check.name.strip('_')
+        if combined_parameter_sets is not None:
             for parameter_set in combined_parameter_sets:
-                kw = self._generate_base_name(list(parameter_set.values())[0], kw_or_base=True)
-                name = f"{check.name.strip('_')}_{kw}"
-
-                # tech debt? Or should I just code this portion as a separate function?
-                reverse_parameter_set = {v: k for k, v in parameter_set.items()}
-                temp_df = df.rename(columns=reverse_parameter_set)
-                r = temp_df[parameter_set.keys()].apply(lambda row: check.run(**row), axis=1)
-
-                if pd.Series in check.expected_arguments.values():
-                    temp_args = dict()
-                    combined_parameter_map = 0
-                    result[name] = r[0]  # confirm this works, seems a little shakey
+                kw = self._generate_base_name(next(iter(parameter_set.values())), kw_or_base=True)
+                name = f"{check_name}_{kw}"
+
+                arguments = self._column_arguments(df, parameter_set)
+                if check.takes_series:
+                    result[name] = check.run(**arguments)
+                elif check.takes_arrays:
+                    result[name] = self._run_check_on_arrays(check, arguments, df.index)
                 else:
-                    result[name] = r
+                    result[name] = self._run_check_per_row(check, arguments, df.index)
         else:  # static args only
-            check_name = check.name.strip('_')
-            if pd.Series in check.expected_arguments.values():
-                # could probably be faster, but fixed it
-                temp_args = dict()
-                for param, col_name in static_args.items():
-                    temp_args[param] = df[col_name]
-                result[check_name] = check.run(**temp_args)
+            arguments = self._column_arguments(df, static_args)
+            if check.takes_series:
+                result[check_name] = check.run(**arguments)
+            elif check.takes_arrays:
+                result[check_name] = self._run_check_on_arrays(check, arguments, df.index)
             else:
-                # tech debt? matches this one but with different parameter sets
-                reverse_parameter_set = {v: k for k, v in static_args.items()}
-                temp_df = df.rename(columns=reverse_parameter_set)
-                result[check_name] = temp_df[static_args.keys()].apply(lambda row: check.run(**row), axis=1)
+                result[check_name] = self._run_check_per_row(check, arguments, df.index)
+        return result
+
+    def _column_arguments(self, df: pd.DataFrame, parameter_set: dict[str, str]) -> dict[str, pd.Series]:
+        """turns the `{parameter: column}` mapping into the `{parameter: pd.Series}` arguments of a check
+
+        Each column is looked up in the dataframe once per `run()`, and reused by the other checks.
+        """
+        arguments = dict()
+        for param, column in parameter_set.items():
+            if column not in self._column_cache:
+                self._column_cache[column] = df[column]
+            arguments[param] = self._column_cache[column]
+        return arguments
+
+    @staticmethod
+    def _run_check_on_arrays(check: Check, arguments: dict[str, pd.Series], index: pd.Index) -> pd.Series:
+        """runs a check typed with `np.ndarray` once, with the whole columns as numpy arrays
+
+        Skips the index alignment of pd.Series for checks that only do array math.
 
-        self.results = self.results | result
+        :param check: the check to run
+        :param arguments: `{parameter: pd.Series}` key-value pairs of the arguments
+        :param index: the index of the dataframe
+        :return: the results of the check, with the same index as the dataframe
+        """
+        results = check.run(**{param: column.to_numpy() for param, column in arguments.items()})
+        return pd.Series(results, index=index)
+
+    @staticmethod
+    def _run_check_per_row(check: Check, arguments: dict[str, pd.Series], index: pd.Index) -> pd.Series:
+        """runs a scalar check once per row, with each `parameter: column` pair giving the argument for the row
+
+        Checks that also work on whole columns (like `return high >= low`) are run once on the columns.
+        Checks created with `jit=True` are run over the whole columns by their numba compiled version,
+        unless a column has a pandas extension dtype (`Int64`, `string`, ...) or holds python objects.
+        Otherwise, pulls each column out as a list once and runs the check over them row by row with
+        `Check.run_per_row()`.
+
+        :param check: the check to run
+        :param arguments: `{parameter: pd.Series}` key-value pairs of the arguments
+        :param index: the index of the dataframe
+        :return: the results of the check, with the same index as the dataframe
+        """
+        if not arguments:
+            # a check without parameters has no columns to go through, so it's called plainly once per row
+            return pd.Series([check.run() for _ in range(len(index))], index=index, dtype=None if len(index) else bool)
+
+        if len(index) > 0:
+            # numba only gets plain numpy columns. `to_numpy()` turns the NA of a nullable column (Int64, boolean,
+            # ...) into NaN or an object array, which would change the results the check gives row by row
+            if check.jit and all(
+                    isinstance(column.dtype, np.dtype) and column.dtype != object for column in arguments.values()
+            ):
+                compiled_results = check.run_compiled(
+                    **{param: column.to_numpy() for param, column in arguments.items()}
+                )
+                if compiled_results is not None:
+                    return pd.Series(compiled_results, index=index)
+
+            vectorized_results = check.run_vectorized(**arguments)
+            if vectorized_results is not None:
+                return vectorized_results
+
+        # `tolist()` boxes the values the way the Series does (pd.Timestamp, not np.datetime64) for the row checks
+        results = check.run_per_row(**{param: column.tolist() for param, column in arguments.items()})
+        return pd.Series(results, index=index, dtype=None if results else bool)
 
     @staticmethod
     def _generate_base_name(field: str, kw_or_base: bool = False) -> str | None:
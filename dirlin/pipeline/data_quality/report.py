@@ -1,8 +1,18 @@
+import re
 from typing import TypeVar
 
 import pandas as pd
 
 
+_NUMBER_CLEANUP_PATTERN = re.compile(r"nan|none|no|,|^\$+|\$+$")
+"""matches the pieces of a messy number string that `Report._clean_number_column()` replaces in a single pass"""
+
+
+def _replace_number_noise(match: re.Match) -> str:
+    """thousands separators and currency signs are dropped, missing-value words become `0`"""
+    return "" if match.group(0)[0] in "$," else "0"
+
+
 class Report:
     """creates a dataframe 'report' usable by the Dirlin Pipeline
 
@@ -122,11 +132,11 @@ class Report:
                     f"{''.join(_check_missing)} missing from class call. The parameters need to be specified"
                 )
 
+            # vectorized, and keeps the index of the dataframe so the values line up with their rows
+            is_negative = working_df[self._key_cash_column] < 0
             for column in self._cash_columns:
-                working_df[column] = pd.Series([
-                    abs(column_val) * -1 if key_val < 0 else abs(column_val)
-                    for column_val, key_val in zip(working_df[column], working_df[self._key_cash_column])
-                ])
+                absolute_values = working_df[column].abs()
+                working_df[column] = absolute_values.mask(is_negative, -absolute_values)
 
         if drop_duplicated_columns:
             """Need to add the logic
@@ -165,18 +175,16 @@ class Report:
         :param field: pd.Series of the number column
         :return: cleaned and formatted number column
         """
+        # separators, currency signs and missing-value words are all cleaned up in one regex pass
         field = (
             field.fillna(0).astype(str)
             .str.lower()
-            .str.replace("nan", "0")
-            .str.strip("$")
-            .str.strip("")
-            .str.replace(",", "")
-            .str.replace("none", "0")
-            .str.replace("no", "0")
+            .str.replace(_NUMBER_CLEANUP_PATTERN, _replace_number_noise, regex=True)
         )
-        field = pd.Series(float(str(c).strip('%')) / 100 for c in field if '%' in c)
-        return field
+        # percentages are converted to fractions, every other value is kept as the number it spells
+        is_percentage = field.str.contains("%", regex=False)
+        numbers = field.str.strip("%").astype(float)
+        return numbers.mask(is_percentage, numbers / 100)
 
 
 ReportType = TypeVar('ReportType', bound=Report)
@@ -17,7 +17,7 @@ class Pipeline:
             folder = (Path.home() / 'Downloads')
             if not folder.exists():
                 raise FileNotFoundError(f"{folder} is not a folder. Please give an argument for `folder`.")
-            folder = Folder(folder)
+            folder = Folder(folder, strict=False)
         elif isinstance(folder, str):
             folder = Folder(folder)
             if not folder.path.exists():
@@ -101,6 +101,36 @@ class Pipeline:
         self.report_name_validation_pairs[report.name_convention] = validation
         self.report_name_results_pairs[report.name_convention] = _results
 
+    def add_report_sets(
+            self,
+            reports: list[ReportType],
+            validation: ValidationType,
+            *,
+            normalize_cash_columns: bool = False,
+            drop_duplicate_columns: bool = False,
+            key_column: str | None = None,
+            field_mapping: dict[str, str] | None = None,
+            infer_shared: bool = True,
+    ):
+        """adds several reports that are checked by the same Validation, see `add_report_set()`
+
+        Reports that share a column layout reuse the parameter mapping the Validation
+        worked out for the first of them.
+
+        :param reports: the reports to format and validate
+        :param validation: the Validation every report is run through
+        """
+        for report in reports:
+            self.add_report_set(
+                report=report,
+                validation=validation,
+                normalize_cash_columns=normalize_cash_columns,
+                drop_duplicate_columns=drop_duplicate_columns,
+                key_column=key_column,
+                field_mapping=field_mapping,
+                infer_shared=infer_shared,
+            )
+
     def run_error_log(
             self,
             report_name: str | None = None,
@@ -118,14 +148,8 @@ class Pipeline:
         # ==== run the Error Log function from the Validation Dictionary ====
         # I'm thinking I'm going to concat these, let's see how they turn out
         if report_name is None:
-            _results = None
-            for report, validation in self.report_name_validation_pairs.items():
-                if _results is None:
-                    _results = validation.generate_error_log()
-                    continue
-                _result = validation.generate_error_log()
-                _results = pd.concat((_results, _result))
-            return _results
+            _results = [validation.generate_error_log() for validation in self.report_name_validation_pairs.values()]
+            return pd.concat(_results)
         if report_name not in self.report_name_validation_pairs:
             raise KeyError(
                 f"Report name `{report_name}` does not exist. Please make sure you enter a valid report name."
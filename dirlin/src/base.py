@@ -1,14 +1,379 @@
+from __future__ import annotations
+
+import fnmatch
+import functools
+import heapq
+import importlib.util
 import os.path
+import re
+import stat
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse
-from urllib.error import HTTPError
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional
+
+if TYPE_CHECKING:
+    # pandas is imported inside the functions that read files, so that `import dirlin` stays cheap
+    import pandas as pd
+
+
+_EXCEL_ENGINE: str | None = "calamine" if importlib.util.find_spec("python_calamine") is not None else None
+"""Rust-backed Excel engine used by `Folder.open()` when `python-calamine` is installed. None uses the pandas default"""
+
+_HAS_PYARROW: bool = importlib.util.find_spec("pyarrow") is not None
+"""whether the multithreaded pyarrow CSV reader is available for `_read_csv_fast()`"""
+
+_ARROW_BLOCK_SIZE: int = 16 * 1024 * 1024
+"""bytes of a csv file parsed per pyarrow block. Larger blocks mean less per-block overhead on big files"""
+
+_ENCODING_SAMPLE_SIZE: int = 64 * 1024
+"""number of bytes fed to the encoding detector at a time"""
+
+_ENCODING_SAMPLE_LIMIT: int = 1024 * 1024
+"""most bytes read from the start of a file to detect its encoding, if the detector isn't confident sooner"""
+
+_PARALLEL_WALK_THRESHOLD: int = 16
+"""number of sub-folders in the root of a recursive search before the walk is spread across threads"""
+
+_GLOB_CHARACTERS: frozenset[str] = frozenset("*?[")
+"""characters that make a filename pattern a glob. Patterns without them name a single file"""
+
+_PROCESS_SUFFIXES: frozenset[str] = frozenset({".xlsx", ".xls", ".xlsb"})
+"""file types whose readers hold the GIL, so they are parsed in worker processes when `use_processes=True`"""
+
+
+def _is_candidate(name: str, skip_hidden: bool = True) -> bool:
+    """filters out temporary (`~`) files from the folder searches, and hidden (`.`) files unless `skip_hidden=False`"""
+    return not name.startswith(("~", ".") if skip_hidden else "~")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> Callable[[str], Any]:
+    """
+    Translates a glob pattern into a compiled regex match function. Cached, since the same naming
+    conventions are searched for over and over by the Folder functions.
+    Case-insensitive on platforms where fnmatch would normalize the case (Windows).
+
+    :param pattern: glob pattern matched against the file names
+    :return: the `match` function of the compiled pattern
+    """
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile(fnmatch.translate(pattern), flags).match
+
+
+def _cutoff_timestamp(days: int) -> float:
+    """
+    Timestamp of local midnight on the first day of a `days` window, so that the mtime of each file can be
+    compared to it as a float. If today is 12/31, days=5 gives 12/26 00:00.
+
+    :param days: number of days to look back
+    :return: the earliest mtime inside the window
+    """
+    return time.mktime((date.today() - timedelta(days=days)).timetuple())
+
+
+def _scan_directory(
+        directory: str | os.PathLike,
+        matches_pattern: Callable[[str], Any],
+        skip_hidden: bool = True) -> tuple[list[os.DirEntry], list[str]]:
+    """
+    Lists a single directory with `os.scandir()`. Used as the unit of work of `_scan_files()`.
+
+    :param directory: the directory to list
+    :param matches_pattern: compiled pattern match function for the file names
+    :param skip_hidden: whether hidden (`.`) files are skipped along with temporary (`~`) files
+    :return: the matching file entries and the paths of the sub-folders. Both empty if the directory can't be listed
+    """
+    files, sub_folders = [], []
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        # the folder was removed or can't be read, the same as `Path.glob()` skipping it
+        return files, sub_folders
+    with entries:
+        for entry in entries:
+            # symlinked folders are not walked into, so that links can't loop, but they aren't files either
+            if entry.is_dir(follow_symlinks=False):
+                sub_folders.append(entry.path)
+                continue
+            if entry.is_dir():
+                continue
+            if _is_candidate(entry.name, skip_hidden) and matches_pattern(entry.name):
+                files.append(entry)
+    return files, sub_folders
+
+
+def _scan_files(
+        root: str | os.PathLike,
+        pattern: str,
+        recurse: bool = False,
+        max_workers: int = 8,
+        skip_hidden: bool = True) -> Iterator[os.DirEntry]:
+    """
+    Walks a directory with `os.scandir()`, yielding the file entries whose name matches the glob pattern.
+
+    Directories are never yielded, and `DirEntry.is_dir()` is answered from the directory listing itself,
+    so callers don't need to stat each result again to skip folders.
+    Temporary (`~`) and, unless `skip_hidden=False`, hidden (`.`) files are skipped.
+
+    When recursing into a folder with more than `_PARALLEL_WALK_THRESHOLD` sub-folders, the sub-folders
+    are listed by a thread pool so that the `readdir` latency of deep or network-mounted trees overlaps.
+
+    A pattern with a folder part (`sub/rep*`) matches the file names in the folders the folder part matches,
+    like `Path.glob()`. With `recurse`, the folder part is matched at any depth, like `Path.rglob()`.
+
+    :param root: the directory to start the walk in
+    :param pattern: glob pattern matched against the file name, optionally with a folder part
+    :param recurse: whether to walk through sub-folders
+    :param max_workers: number of threads used for the parallel walk
+    :param skip_hidden: whether hidden (`.`) files are skipped along with temporary (`~`) files
+    :return: generator of os.DirEntry objects for the matching files
+    """
+    folder_pattern, pattern = os.path.split(pattern)
+    if folder_pattern:
+        matches_pattern = _compile_pattern(pattern)
+        folders = Path(root).rglob(folder_pattern) if recurse else Path(root).glob(folder_pattern)
+        for folder in folders:
+            # anything the folder part matches that isn't a folder can't be listed, so it gives no files
+            yield from _scan_directory(folder, matches_pattern, skip_hidden)[0]
+        return
+
+    # the compiled pattern is shared by every folder of the walk
+    matches_pattern = _compile_pattern(pattern)
+
+    files, sub_folders = _scan_directory(root, matches_pattern, skip_hidden)
+    yield from files
+    if not recurse:
+        return
+
+    if len(sub_folders) <= _PARALLEL_WALK_THRESHOLD:
+        while sub_folders:
+            files, found_folders = _scan_directory(sub_folders.pop(), matches_pattern, skip_hidden)
+            yield from files
+            sub_folders.extend(found_folders)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(_scan_directory, folder, matches_pattern, skip_hidden) for folder in sub_folders}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, found_folders = future.result()
+                yield from files
+                pending.update(
+                    executor.submit(_scan_directory, folder, matches_pattern, skip_hidden) for folder in found_folders
+                )
+
+
+def _scan_file_times(
+        root: str | os.PathLike,
+        pattern: str,
+        recurse: bool = False,
+        skip_hidden: bool = True) -> Iterator[tuple[float, str]]:
+    """
+    Yields the `(mtime, path)` of the files matching the glob pattern.
+
+    A pattern without any glob characters names a single file (`rep.csv`, `sub/rep.csv`), so outside of
+    recursive searches it is stat-ed directly.
+
+    :param root: the directory to search in
+    :param pattern: glob pattern matched against the file name, optionally with a folder part
+    :param recurse: whether to search through sub-folders
+    :param skip_hidden: whether hidden (`.`) files are skipped along with temporary (`~`) files
+    :return: generator of `(mtime, path)` tuples
+    """
+    if not recurse and not _GLOB_CHARACTERS.intersection(pattern):
+        name = os.path.basename(pattern)
+        if not name or not _is_candidate(name, skip_hidden):
+            return
+        path = os.path.join(root, pattern)
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return
+        if not stat.S_ISDIR(file_stat.st_mode):
+            yield file_stat.st_mtime, path
+        return
+
+    for entry in _scan_files(root, pattern, recurse, skip_hidden=skip_hidden):
+        yield entry.stat().st_mtime, entry.path
+
 
-import pandas as pd
-import pandas.errors
+def _read_csv_fast(file_path: str | Path, *args, **kwargs) -> pd.DataFrame:
+    """
+    Reads a csv file with pyarrow's multithreaded CSV reader when it is installed, converting to pandas
+    only at the end. Falls back to `pd.read_csv()` when reader arguments are given (they are pandas
+    specific) or when pyarrow can't parse the file.
 
-import chardet
+    `dtype_backend="pyarrow"` is the one argument kept on the pyarrow path: the columns are handed over as
+    Arrow-backed dtypes without converting them to numpy.
+
+    Note that pyarrow infers ISO-8601 date columns as datetimes, where pandas leaves them as strings.
+
+    :param file_path: path to the csv file
+    :param args: arguments for `pd.read_csv()`
+    :param kwargs: keyword arguments for `pd.read_csv()`
+    :return: DataFrame of the csv file
+    """
+    import pandas as pd
+
+    arrow_backed = kwargs.get("dtype_backend") == "pyarrow"
+    if _HAS_PYARROW and not args and (not kwargs or (arrow_backed and len(kwargs) == 1)):
+        import pyarrow
+        import pyarrow.csv
+
+        try:
+            table = pyarrow.csv.read_csv(
+                file_path,
+                read_options=pyarrow.csv.ReadOptions(use_threads=True, block_size=_ARROW_BLOCK_SIZE),
+                convert_options=pyarrow.csv.ConvertOptions(strings_can_be_null=True)
+            )
+            if arrow_backed:
+                return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+            return table.to_pandas(self_destruct=True)
+        except pyarrow.ArrowInvalid:
+            pass
+    return pd.read_csv(file_path, *args, **kwargs)
+
+
+def _read_text(file_path: Path, *args, **kwargs) -> pd.DataFrame:
+    """
+    Reads a .csv or .txt file, retrying with a more lenient parser when the C parser fails and
+    with a guessed encoding when the file isn't utf-8.
+
+    :param file_path: path to the text file
+    :param args: arguments for `pd.read_csv()`
+    :param kwargs: keyword arguments for `pd.read_csv()`
+    :return: DataFrame of the text file
+    """
+    import pandas as pd
+
+    try:
+        return _read_csv_fast(file_path, *args, **kwargs)
+    except pd.errors.ParserError:
+        if _HAS_PYARROW:
+            # the pyarrow engine skips bad lines as well, without the pure python tokenizer's cost
+            print("Could not parse in C, attempting to reparse with pyarrow...")
+            try:
+                return pd.read_csv(file_path, engine='pyarrow', on_bad_lines='warn', *args, **kwargs)
+            except ValueError as arrow_error:
+                print(f"{arrow_error}")
+        print("Could not parse in C, attempting to reparse in Python...")
+        return pd.read_csv(file_path, engine='python', on_bad_lines='warn', *args, **kwargs)
+    except UnicodeDecodeError as uni_error:
+        # chardet loads large encoding tables, so only import it when a file needs it
+        import chardet
+
+        print(f"{uni_error}")
+        print(f"reattempting to parse with chardet...")
+        # the detector is fed chunks until it is confident, reading the whole file can exhaust memory
+        detector = chardet.UniversalDetector()
+        with open(file_path, "rb") as f:
+            for _ in range(_ENCODING_SAMPLE_LIMIT // _ENCODING_SAMPLE_SIZE):
+                chunk = f.read(_ENCODING_SAMPLE_SIZE)
+                if not chunk:
+                    break
+                detector.feed(chunk)
+                if detector.done:
+                    break
+        file_path_encoding = detector.close()
+        return pd.read_csv(file_path, encoding=file_path_encoding['encoding'], *args, **kwargs)
+
+
+def _prefetch(file_path: str | Path) -> None:
+    """
+    Asks the OS to start reading the whole file into the page cache, so the many small reads a reader
+    makes afterwards are served from memory. Only a hint, and skipped where `posix_fadvise` isn't available.
+
+    :param file_path: path to the file that is about to be read
+    :return: None
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _read_excel(file_path: Path, *args, **kwargs) -> pd.DataFrame:
+    """
+    Reads the first sheet of an Excel file (unless `sheet_name` is given), using calamine when it's installed.
+
+    :param file_path: path to the Excel file
+    :param args: arguments for `pd.read_excel()`
+    :param kwargs: keyword arguments for `pd.read_excel()`
+    :return: DataFrame of the sheet
+    """
+    import pandas as pd
+
+    kwargs.setdefault("sheet_name", 0)
+    if _EXCEL_ENGINE is not None:
+        kwargs.setdefault("engine", _EXCEL_ENGINE)
+    # the readers seek around the zip archive in small reads, which are slow on a cold cache
+    _prefetch(file_path)
+    return pd.read_excel(file_path, *args, **kwargs)
+
+
+def _read_json(file_path: Path, *args, **kwargs) -> pd.DataFrame:
+    """
+    Reads a .json file.
+
+    :param file_path: path to the json file
+    :param args: arguments for `pd.read_json()`
+    :param kwargs: keyword arguments for `pd.read_json()`
+    :return: DataFrame of the json file
+    """
+    import pandas as pd
+
+    return pd.read_json(file_path, *args, **kwargs)
+
+
+def _combine_csv_with_duckdb(file_paths: list[str]) -> pd.DataFrame:
+    """
+    Reads a list of csv files into a single DataFrame with DuckDB, which parses the files in parallel
+    and builds the combined frame in one go. Used by `Folder.find_and_combine(use_duckdb=True)`.
+    Columns are matched by name across files, and rows keep the order of `file_paths`.
+
+    :param file_paths: full paths to the csv (or .txt) files
+    :return: DataFrame of all the files with a categorical `From` column
+    """
+    try:
+        import duckdb
+    except ImportError as e:
+        raise ImportError("use_duckdb requires duckdb to be installed, see the `duckdb` extra") from e
+
+    unsupported = [path for path in file_paths if Path(path).suffix not in (".csv", ".txt")]
+    if unsupported:
+        raise ValueError(f"use_duckdb only combines .csv and .txt files. Got {', '.join(unsupported)}.")
+
+    with duckdb.connect() as connection:
+        df = connection.read_csv(file_paths, filename=True, union_by_name=True).df()
+    df["From"] = df.pop("filename").map({path: Path(path).stem for path in file_paths}).astype("category")
+    return df
+
+
+def _open_file(folder: "Folder", file_path: str, args: tuple, kwargs: dict) -> pd.DataFrame:
+    """
+    Opens a single file for `Folder.find_and_combine()` and tags the rows with the file they came from.
+    Kept at module level so that it can be pickled into worker processes.
+
+    :param folder: the Folder used to open the file
+    :param file_path: full path to the file, or a url
+    :param args: arguments for the pandas reader
+    :param kwargs: keyword arguments for the pandas reader
+    :return: DataFrame of the file with a `From` column
+    """
+    df = folder.open(file_path, *args, **kwargs)
+    df["From"] = file_path if "://" in file_path else Path(file_path).stem
+    return df
 
 
 class Document:
@@ -72,7 +437,17 @@ class Document:
 
 
 class Folder:
-    def __init__(self, folder_path: Path | str):
+    _READERS: dict[str, Callable[..., pd.DataFrame]] = {
+        ".xlsx": _read_excel,
+        ".xls": _read_excel,
+        ".xlsb": _read_excel,
+        ".csv": _read_text,
+        ".txt": _read_text,
+        ".json": _read_json,
+    }
+    """maps a file suffix to the reader `open()` uses for it"""
+
+    def __init__(self, folder_path: Path | str, cache_ttl: float = 0, *, strict: bool = True):
         """Object used for processing files through local directories.
         Good for partially built out automated processes that can be done on a single computer.
 
@@ -80,8 +455,10 @@ class Folder:
             - open() : opens a path file and converts it into a dataframe
             - open_recent(): opens the most recent file as a dataframe based on naming conventions
             - find_and_combine(): finds all files that follow naming conventions and creates a single dataframe
+            - open_many(): opens a list of files in parallel, returning one dataframe per file
             - as_map(): creates a dictionary based on two columns from dataframe
             - index_files(): creates a list of paths based on file_ext or file suffixes (.csv, .xlsx, etc.)
+            - iter_files(): lazily yields the (mtime, path) of files that follow a naming convention
 
         ...
 
@@ -95,12 +472,16 @@ class Folder:
                 - path: the directory path the folder is set to
 
         :param folder_path: Path to the Folder. This is the directory the functions will use to search files in
+        :param cache_ttl: defaults to 0, which re-scans the folder on every search. Seconds a directory listing is
+        reused across searches, so files added or changed within that time may not be picked up until `refresh()`
+        :param strict: defaults to True, confirms the path is a directory. Set to False to skip the check when the
+        path is already known to be a valid directory
         """
         if isinstance(folder_path, str):
             folder_path = Path(folder_path)
         self.path = folder_path
 
-        if not self.path.is_dir():
+        if strict and not os.path.isdir(self.path):
             raise ValueError(f"Expected a path to a folder / directory. Got {self.path}.")
 
         # (8) wanted to add a way to get the path of open_recent
@@ -108,12 +489,65 @@ class Folder:
         self.path_open_recent: Path | None = None
         """stores the most recent path used on self.open_recent or self.open_recent_as_document()"""
 
+        self.cache_ttl: float = cache_ttl
+        """seconds a directory listing in `_listing_cache` is considered fresh"""
+
+        self._listing_cache: dict[tuple[str, bool, bool], tuple[float, list[tuple[float, str]]]] = dict()
+        """`(pattern, recurse, skip_hidden): (time listed, [(mtime, path)])` key-value pairs of previous scans"""
+
     def __repr__(self):
         return f"{self.path}"
 
     def __str__(self):
         return f"{self.path}"
 
+    def refresh(self) -> None:
+        """Clears the cached directory listings so that the next search re-scans the folder."""
+        self._listing_cache.clear()
+
+    def _iter_listing(
+            self,
+            pattern: str,
+            recurse: bool = False,
+            skip_hidden: bool = True) -> Iterator[tuple[float, str]]:
+        """
+        Yields the files matching the pattern as `(mtime, path)` pairs while the folder is walked.
+        Repeated searches within `cache_ttl` seconds reuse the previous scan. A scan is only cached once it
+        has been walked to the end.
+
+        :param pattern: glob pattern matched against the file names
+        :param recurse: whether to recurse through sub-folders
+        :param skip_hidden: whether hidden (`.`) files are skipped along with temporary (`~`) files
+        :return: generator of `(mtime, path)` tuples, in directory order
+        """
+        key = (pattern, recurse, skip_hidden)
+        now = time.monotonic()
+        cached = self._listing_cache.get(key)
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            yield from cached[1]
+            return
+
+        if self.cache_ttl <= 0:
+            yield from _scan_file_times(self.path, pattern, recurse, skip_hidden)
+            return
+
+        files = []
+        for file in _scan_file_times(self.path, pattern, recurse, skip_hidden):
+            files.append(file)
+            yield file
+        self._listing_cache[key] = (now, files)
+
+    def _list_files(self, pattern: str, recurse: bool = False, skip_hidden: bool = True) -> list[tuple[float, str]]:
+        """
+        Lists the files matching the pattern as `(mtime, path)` pairs. See `_iter_listing()` for the caching.
+
+        :param pattern: glob pattern matched against the file names
+        :param recurse: whether to recurse through sub-folders
+        :param skip_hidden: whether hidden (`.`) files are skipped along with temporary (`~`) files
+        :return: list of `(mtime, path)` tuples, in directory order
+        """
+        return list(self._iter_listing(pattern, recurse, skip_hidden))
+
     def _find_recent_files(
             self,
             filename_pattern: str,
@@ -130,80 +564,73 @@ class Folder:
         :param recurse: whether to recurse through sub-folders
         :return: Path object that meets the parameters
         """
-
-        asterisks_mapping = {
-            True: f"{filename_pattern}*",
-            False: filename_pattern
-        }
-
-        if recurse:
-            files = [
-                f for f in self.path.rglob(pattern=f"{asterisks_mapping[with_asterisks]}")
-                if date.fromtimestamp(f.stat().st_mtime) >= (date.today() - timedelta(days=days))
-                and not f.name.startswith("~")
-            ]
-        else:
-            files = [
-                f for f in self.path.glob(pattern=f"{asterisks_mapping[with_asterisks]}")
-                if date.fromtimestamp(f.stat().st_mtime) >= (date.today() - timedelta(days=days))
-                and not f.name.startswith("~")
-            ]
-        try:
-            most_recent_file = Path(sorted(files, key=os.path.getmtime, reverse=True)[0])
-            return most_recent_file
-        except IndexError:
+        pattern = f"{filename_pattern}*" if with_asterisks else filename_pattern
+
+        cutoff_ts = _cutoff_timestamp(days)
+        # only the newest file is needed, so it is picked with a single max() pass
+        # hidden files can be the most recent file, only temporary (`~`) files are skipped
+        most_recent = max(
+            (file for file in self._list_files(pattern, recurse, skip_hidden=False) if file[0] >= cutoff_ts),
+            default=None
+        )
+        if most_recent is None:
             raise FileNotFoundError(
                 f"No reports found in '{self.path.parent.name}/{self.path.name}' directory in the past {days} days.")
+        return Path(most_recent[1])
 
     def open(self, file_path: str | Path, *args, **kwargs) -> pd.DataFrame:
         """
         Opens a string or pathlib.Path object into a pandas.DataFrame object.
-        Currently, reads .xlsx, .xls, .csv, .json file extensions, and will raise a
+        Currently, reads .xlsx, .xls, .xlsb, .csv, .json file extensions, and will raise a
         KeyError for any other file types.
 
-        :param file_path: path to the file you want to open
+        Excel files are read with the `calamine` engine when `python-calamine` is installed, which is much
+        faster than `openpyxl`. Calamine reads the cached values of formulas and can return date-only or
+        time-only cells as `datetime.date` / `datetime.time` objects instead of Timestamps.
+        Pass `engine="openpyxl"` to keep the previous behavior.
+
+        Text files opened without any reader arguments are parsed by pyarrow's multithreaded CSV reader
+        when `pyarrow` is installed. Pass `dtype_backend="pyarrow"` to also keep the columns Arrow-backed, or any
+        other `pd.read_csv()` argument (e.g. `engine="c"`) to use pandas instead.
+
+        :param file_path: path to the file you want to open, or a Google Sheets csv export url
         :param args: see documentation for pd.DataFrame object
         :param kwargs: see documentation for pd.DataFrame object
         :return: pd.DataFrame object of the file
         """
         if isinstance(file_path, str):
+            if "://" in file_path:
+                return self._open_url(file_path, *args, **kwargs)
             file_path = Path(file_path)
 
-        if not file_path.exists():
+        # absolute paths are handed straight to pandas, which raises FileNotFoundError if they don't exist
+        if not file_path.is_absolute() and not file_path.exists():
             file_path = self.path / file_path
 
-        # Valid File Types
-        _excel_types = (".xlsx", ".xls", ",xlsb")
-        _text_types = (".txt", ".csv")
+        reader = self._READERS.get(file_path.suffix)
+        if reader is not None:
+            return reader(file_path, *args, **kwargs)
+        raise KeyError(f"File suffix {file_path.suffix} is an unsupported format.")
 
-        if file_path.suffix in _excel_types:
-            if "sheet_name" not in kwargs.keys():
-                kwargs["sheet_name"] = 0
-            return pd.read_excel(file_path, *args, **kwargs)
+    @staticmethod
+    def _open_url(url: str, *args, **kwargs) -> pd.DataFrame:
+        """
+        Opens a Google Sheets csv export link (a docs.google.com url with `format=csv`) into a DataFrame.
+        Kept separate from open() so that local files never pay for the url parsing.
 
-        elif file_path.suffix in _text_types:
-            try:
-                return pd.read_csv(file_path, *args, **kwargs)
-            except pandas.errors.ParserError:
-                print("Could not parse in C, attempting to reparse in Python...")
-                return pd.read_csv(file_path, engine='python', on_bad_lines='warn', *args, **kwargs)
-            except UnicodeDecodeError as uni_error:
-                print(f"{uni_error}")
-                print(f"reattempting to parse with chardet...")
-                with open(file_path, "rb") as f:
-                    file_path_encoding = chardet.detect(f.read())
-                    return pd.read_csv(file_path, encoding=file_path_encoding['encoding'], *args, **kwargs)
-
-        elif file_path.suffix == ".json":
-            return pd.read_json(file_path, *args, **kwargs)
-        try:
-            url = urlparse(str(file_path))
-            if url.netloc == "docs.google.com" and "format=csv" in url.query.split("&"):
-                return pd.read_csv(file_path, *args, **kwargs)
-        except HTTPError as e:
-            raise e
-        else:
-            raise KeyError(f"File suffix {file_path.suffix} is an unsupported format.")
+        :param url: the url of the sheet
+        :param args: arguments for `pd.read_csv()`
+        :param kwargs: keyword arguments for `pd.read_csv()`
+        :return: pd.DataFrame object of the sheet
+        """
+        from urllib.parse import urlparse
+
+        import pandas as pd
+
+        parsed_url = urlparse(url)
+        if parsed_url.netloc == "docs.google.com" and "format=csv" in parsed_url.query.split("&"):
+            return pd.read_csv(url, *args, **kwargs)
+        raise KeyError(f"Url {url} is an unsupported format. Expected a Google Sheets link with `format=csv`.")
 
     def open_as_document(self, file_path: str | Path, *args, **kwargs) -> Document:
         df = self.open(file_path, *args, **kwargs)
@@ -266,75 +693,221 @@ class Folder:
         :param kwargs: keyword arguments in the pd.DataFrame.from_csv() or pd.DataFrame.from_excel() functions
         :return: Dictionary of the two columns
         """
-        try:
-            if isinstance(file_path, str):
-                file_path = self.path / file_path
-        except Exception as e:
-            raise e
+        if isinstance(file_path, str):
+            file_path = self.path / file_path
         df = self.open(file_path=file_path, *args, **kwargs)
 
-        if not all([column in df.columns for column in (key_column, value_column)]):
-            raise f"Expected key {key_column} and value {value_column}. Missing one or all from the Dataframe."
-        mapping = {
-            k: v for k, v in zip(df[key_column], df[value_column])
-        }
+        missing_columns = [column for column in (key_column, value_column) if column not in df.columns]
+        if missing_columns:
+            raise KeyError(
+                f"Expected key {key_column} and value {value_column}. Missing {missing_columns} from the Dataframe."
+            )
+        # object arrays hand back python scalars (like iterating the Series did) without the per-row Series overhead
+        mapping = dict(zip(df[key_column].to_numpy(dtype=object), df[value_column].to_numpy(dtype=object)))
         return mapping
 
     def find_and_combine(
             self,
             filename_pattern: str = "",
             with_asterisks: bool = True,
-            recurse: bool = False, *args, **kwargs) -> pd.DataFrame:
+            recurse: bool = False,
+            *args,
+            max_workers: int | None = None,
+            days: int | None = None,
+            only_first_x: int | None = None,
+            use_duckdb: bool = False,
+            errors: str = "raise",
+            use_processes: bool = False,
+            **kwargs) -> pd.DataFrame:
         """
         Uses a filename pattern to find all files that follow the naming convention
-        and converts the files into a single DataFrame object6
+        and converts the files into a single DataFrame object.
+
+        Files are parsed in parallel on threads. Excel files can be read in worker processes instead with
+        `use_processes=True`, which needs the call to be under an `if __name__ == "__main__":` guard in scripts.
 
         :param filename_pattern: the naming convention of the files you are searching for
         :param with_asterisks: defaults to True. Determines whether an asterisks are added at the end of the
         filename pattern
 
         :param recurse: defaults to False. Determines whether to search for sub-folders
+        :param max_workers: number of workers. Defaults to the number of CPUs, 1 opens the files in order
+        :param days: only combines files modified in the past x number of days. Defaults to all files
+        :param only_first_x: only combines the x most recently modified files. Defaults to all files
+        :param use_duckdb: defaults to False. Combines csv files with DuckDB's parallel csv reader instead of
+        pandas, which keeps memory lower on large archives. Requires `duckdb`, and can't be used with reader args
+        :param errors: defaults to "raise", which raises the error of the first file that can't be opened.
+        "skip" prints a message and leaves the file out instead
+        :param use_processes: defaults to False. Reads Excel files in worker processes, which is faster for many
+        Excel files since their readers hold the GIL. Scripts need an `if __name__ == "__main__":` guard
         :param args: args used in pd.DataFrame objects
         :param kwargs: keyword args used in pd.DataFrame objects
-        :return: a DataFrame object of all the files that share similar naming conventions in a folder
+        :return: a DataFrame object of all the files that share similar naming conventions in a folder,
+        with a categorical `From` column holding the name of the file each row came from
         """
 
-        asterisks_mapping = {
-            True: f"{filename_pattern}*",
-            False: filename_pattern
-        }
         if not with_asterisks and filename_pattern == "":
             raise ValueError(f"filename_pattern cannot be left as default if with_asterisks parameter is set to False")
 
+        found = self.iter_files(filename_pattern, with_asterisks, recurse, days)
+        if only_first_x is not None:
+            # picks the newest files in one pass (O(n log x))
+            found = iter(heapq.nlargest(only_first_x, found))
+
+        if use_duckdb:
+            if args or kwargs:
+                raise ValueError("Reader arguments are specific to pandas and can't be used with use_duckdb.")
+            files = sorted(found, reverse=True)
+            if not files:
+                return None
+            return _combine_csv_with_duckdb([str(file) for _, file in files])
+
         df = None
-        if recurse:
-            files = [
-                f for f in self.path.glob(
-                    pattern=f"{asterisks_mapping[with_asterisks]}"
-                ) if not f.name.startswith("~") and not f.name.startswith(".")
-            ]
-        else:
-            files = [
-                f for f in self.path.rglob(
-                    pattern=f"{asterisks_mapping[with_asterisks]}"
-                ) if not f.name.startswith("~") and not f.name.startswith(".")
-            ]
-
-        files = sorted(files, key=os.path.getmtime, reverse=True)
-        for file in files:
-            if file.is_dir():
-                """
-                This is used for when the recurse is True so that it doesn't raise an error
-                """
-                continue
-            temp = self.open(file, *args, **kwargs)
-            temp["From"] = file.stem
-            if df is None:
-                df = temp
-                continue
-            df = pd.concat((df, temp))
+
+        # files are opened as the walk finds them, so parsing starts before the whole tree has been listed
+        files: list[tuple[float, Path]] = []
+
+        def _walk() -> Iterator[Path]:
+            for mtime, file in found:
+                files.append((mtime, file))
+                yield file
+
+        opened = dict(self._iter_opened(_walk(), args, kwargs, max_workers, errors, use_processes))
+
+        # keeps the most recent files first, regardless of the order the workers finished in
+        frames = [opened[file] for _, file in sorted(files, reverse=True) if file in opened]
+        if frames:
+            import pandas as pd
+
+            # all the files are joined in a single concat, which copies each row once
+            df = pd.concat(frames, ignore_index=True, copy=False)
+            # every row of a file repeats the same name, so a categorical stores each name once
+            df["From"] = df["From"].astype("category")
         return df
 
+    def open_many(
+            self,
+            paths: Iterable[str | Path],
+            *args,
+            max_workers: int | None = None,
+            errors: str = "raise",
+            use_processes: bool = False,
+            **kwargs) -> list[pd.DataFrame]:
+        """
+        Opens several files in parallel and returns one DataFrame per file, in the same order
+        as `paths`. Each DataFrame gets a `From` column with the name of the file it came from.
+        Raises the error of the first file that can't be opened, unless `errors="skip"`.
+
+        :param paths: the files to open, relative paths are looked up in this folder. Urls are opened with `open()`
+        :param max_workers: number of workers. Defaults to the number of CPUs, 1 opens the files in order
+        :param errors: defaults to "raise". "skip" prints a message for files that can't be opened and leaves them out
+        :param use_processes: defaults to False. Reads Excel files in worker processes. Scripts need an
+        `if __name__ == "__main__":` guard
+        :param args: args used in pd.DataFrame objects
+        :param kwargs: keyword args used in pd.DataFrame objects
+        :return: list of DataFrames of the files that could be opened
+        """
+        # urls are kept as strings, since `Path` would collapse the `//` of the scheme
+        paths = [path if isinstance(path, str) and "://" in path else Path(path) for path in paths]
+        opened = dict(self._iter_opened(paths, args, kwargs, max_workers, errors, use_processes))
+        return [opened[path] for path in paths if path in opened]
+
+    def _iter_opened(
+            self,
+            paths: Iterable[Path | str],
+            args: tuple,
+            kwargs: dict,
+            max_workers: int | None = None,
+            errors: str = "raise",
+            use_processes: bool = False) -> Iterator[tuple[Path | str, pd.DataFrame]]:
+        """
+        Opens the files as `paths` yields them and yields `(path, DataFrame)` pairs as the reads finish.
+        Shared by `open_many()` and `find_and_combine()`.
+
+        Files are read on threads, since the pandas and pyarrow parsers release the GIL while parsing and the
+        frames don't need to be pickled back. Excel readers hold the GIL, so with `use_processes=True` Excel
+        files are read in worker processes instead.
+
+        :param paths: the files to open, as Paths or url strings
+        :param args: args used in pd.DataFrame objects
+        :param kwargs: keyword args used in pd.DataFrame objects
+        :param max_workers: number of workers. Defaults to the number of CPUs, 1 opens the files in order
+        :param errors: "raise" re-raises the error of a file that can't be opened, "skip" prints it and moves on
+        :param use_processes: whether Excel files are read in worker processes instead of threads
+        :return: generator of `(path, DataFrame)` tuples, in the order the reads finish
+        """
+        if errors not in ("raise", "skip"):
+            raise ValueError(f"errors must be 'raise' or 'skip'. Got {errors!r}.")
+
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1:
+            for file in paths:
+                try:
+                    yield file, _open_file(self, str(file), args, kwargs)
+                except Exception as e:
+                    if errors == "raise":
+                        raise
+                    print(f"Could not open `{getattr(file, 'name', file)}`, skipping the file: {e}")
+            return
+
+        # the pools are only started once a file needs them
+        executors: dict[bool, ThreadPoolExecutor | ProcessPoolExecutor] = dict()
+        pending: dict = dict()
+
+        def _collect(finished) -> Iterator[tuple[Path | str, pd.DataFrame]]:
+            for future in finished:
+                finished_file = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    if errors == "raise":
+                        raise  # the pools are shut down below, cancelling the reads that haven't started
+                    print(f"Could not open `{getattr(finished_file, 'name', finished_file)}`, skipping the file: {e}")
+                    continue
+                yield finished_file, result
+
+        try:
+            for file in paths:
+                in_process = use_processes and isinstance(file, Path) and file.suffix in _PROCESS_SUFFIXES
+                if in_process not in executors:
+                    pool = ProcessPoolExecutor if in_process else ThreadPoolExecutor
+                    executors[in_process] = pool(max_workers=workers)
+                pending[executors[in_process].submit(_open_file, self, str(file), args, kwargs)] = file
+                # caps the number of queued reads so a huge tree doesn't pile up pending work
+                if len(pending) >= 2 * workers:
+                    yield from _collect(wait(pending, return_when=FIRST_COMPLETED).done)
+            yield from _collect(as_completed(list(pending)))
+        finally:
+            for executor in executors.values():
+                executor.shutdown(cancel_futures=True)
+
+    def iter_files(
+            self,
+            filename_pattern: str = "",
+            with_asterisks: bool = True,
+            recurse: bool = False,
+            days: int | None = None,
+    ) -> Iterator[tuple[float, Path]]:
+        """Lazily yields the files that follow the naming convention as `(mtime, Path)` pairs while the folder
+        is walked, so callers can start working on files before the whole tree has been listed.
+
+        Files are yielded in directory order, not by modified time. Uses the listing cache when `cache_ttl` is set.
+
+        :param filename_pattern: the naming convention of the files you are searching for
+        :param with_asterisks: defaults to True, adds the asterisks at the end of the filename_pattern arg
+        :param recurse: defaults to False. Determines whether to search for sub-folders
+        :param days: only yields files modified in the past x number of days. Defaults to all files
+        :return: generator of `(mtime, Path)` tuples
+        """
+        pattern = f"{filename_pattern}*" if with_asterisks else filename_pattern
+        cutoff_ts = None
+        if days is not None:
+            cutoff_ts = _cutoff_timestamp(days)
+
+        for mtime, path in self._iter_listing(pattern, recurse):
+            if cutoff_ts is None or mtime >= cutoff_ts:
+                yield mtime, Path(path)
+
     def index_files(
             self,
             file_ext: str,
@@ -348,15 +921,4 @@ class Folder:
         :param recurse: Defaults to False. If True, will recurse through subdirectories
         :return: list of Pathlib.Path objects representing a file
         """
-        if recurse:
-            files = [
-                f for f in self.path.rglob(
-                    pattern=f"{filename_convention}{file_ext}"
-                ) if not f.name.startswith("~") and not f.name.startswith(".")
-            ]
-        else:
-            files = [
-                f for f in self.path.glob(pattern=f"{filename_convention}{file_ext}")
-                if not f.name.startswith("~") and not f.name.startswith(".")
-            ]
-        return files
+        return [Path(entry.path) for entry in _scan_files(self.path, f"{filename_convention}{file_ext}", recurse)]
@@ -0,0 +1,26 @@
+import inspect
+import typing
+
+from dirlin.pipeline import Check
+
+
+def _high_above_low(high: float, low: float) -> bool:
+    return high >= low
+
+
+def test_check_class_annotations():
+    """Check instances expose the function annotations without replacing the annotations of the class"""
+    assert typing.get_type_hints(Check) == {}
+    assert inspect.get_annotations(Check) == {}
+    assert Check(_high_above_low).__annotations__ == {"high": float, "low": float, "return": bool}
+
+
+def test_checks_of_the_same_function_dont_share_metadata():
+    """changing the expected arguments of one Check leaves the other Checks of the same function alone"""
+    first, second = Check(_high_above_low), Check(_high_above_low)
+    first.expected_arguments["low"] = int
+    first.__annotations__.clear()
+
+    assert second.expected_arguments == {"high": float, "low": float}
+    assert Check(_high_above_low).expected_arguments == {"high": float, "low": float}
+    assert Check(_high_above_low).__annotations__ == {"high": float, "low": float, "return": bool}
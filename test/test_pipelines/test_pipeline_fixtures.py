@@ -17,44 +17,46 @@ Don't remember the error code but would want to catch these types of errors.
 """
 
 
+_SINGLE_STOCK_DF = pd.DataFrame({
+    "tsm_gross_income": [150, 160, 170, 180, 190, 200],
+    "tsm_expenses": [25, 20, 40, 30, 35, 45],
+})
+"""built once when the module is imported. The fixtures below hand out copies, so tests can't change it"""
+
+_SINGLE_STOCK_DF_B = pd.DataFrame({
+    "appl_gross_income": [112, 160, 563, 345, 543, 235],
+    "appl_expenses": [25, 20, 40, 30, 35, 45],
+})
+
+_TWO_STOCK_DF = pd.DataFrame({
+    "tsm_gross_income": [150, 160, 170, 180, 190, 200],
+    "tsm_expenses": [25, 20, 40, 30, 35, 45],
+    "vt_gross_income": [100, 110, 111, 113, 115, 117],
+    "vt_expenses": [25, 20, 40, 30, 35, 45],
+})
+
+_SIMILAR_FIELD_NAME_DF = pd.DataFrame({
+    "tsm_gross_income": [150, 160, 170, 180, 190, 200],
+    "total_gross_income": [25, 20, 40, 30, 35, 45],
+})
+
+
 def single_stock_df() -> pd.DataFrame:
     """a pretty standard dataframe for our use case."""
-    data = {
-        "id": [0, 1, 2, 3, 4, 5],
-        "tsm_gross_income": [150, 160, 170, 180, 190, 200],
-        "tsm_expenses": [25, 20, 40, 30, 35, 45],
-    }
-    return pd.DataFrame.from_dict(data).copy()
+    return _SINGLE_STOCK_DF.copy()
 
 
 def single_stock_df_b() -> pd.DataFrame:
     """a pretty standard dataframe for our use case."""
-    data = {
-        "id": [0, 1, 2, 3, 4, 5],
-        "appl_gross_income": [112, 160, 563, 345, 543, 235],
-        "appl_expenses": [25, 20, 40, 30, 35, 45],
-    }
-    return pd.DataFrame.from_dict(data).copy()
+    return _SINGLE_STOCK_DF_B.copy()
 
 
 def two_stock_df() -> pd.DataFrame:
-    data = {
-        "id": [0, 1, 2, 3, 4, 5],
-        "tsm_gross_income": [150, 160, 170, 180, 190, 200],
-        "tsm_expenses": [25, 20, 40, 30, 35, 45],
-        "vt_gross_income": [100, 110, 111, 113, 115, 117],
-        "vt_expenses": [25, 20, 40, 30, 35, 45],
-    }
-    return pd.DataFrame.from_dict(data)
+    return _TWO_STOCK_DF.copy()
 
 
 def similar_field_name_df() -> pd.DataFrame:
-    data = {
-        "id": [0, 1, 2, 3, 4, 5],
-        "tsm_gross_income": [150, 160, 170, 180, 190, 200],
-        "total_gross_income": [25, 20, 40, 30, 35, 45],
-    }
-    return pd.DataFrame.from_dict(data)
+    return _SIMILAR_FIELD_NAME_DF.copy()
 
 
 def std_check_function(stock_gross_income: Any, stock_expenses: Any) -> bool:
@@ -71,20 +73,8 @@ def series_check_function(stock_gross_income: pd.Series, stock_expenses: pd.Seri
 
     :return:
     """
-    results = []
-    for gi, e in zip(stock_gross_income, stock_expenses):
-        if gi - e == 140:
-            results.append(True)
-            continue
-        results.append(False)
-    return pd.Series(results)
+    return stock_gross_income - stock_expenses == 140
 
 
 def same_name_check(total_gross_income: pd.Series, carrier_gross_income: pd.Series):
-    results = []
-    for gi, e in zip(total_gross_income, carrier_gross_income):
-        if gi - e == 140:
-            results.append(True)
-            continue
-        results.append(False)
-    return pd.Series(results)
+    return total_gross_income - carrier_gross_income == 140
@@ -1,3 +1,8 @@
+import warnings
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
 import pytest
 
 from dirlin.pipeline import Check, Validation, Report, Pipeline
@@ -20,8 +25,8 @@ Don't remember the error code but would want to catch these types of errors.
 
 
 _test_check_cases = [
-    _shared_param_with_single_field,
-    (two_stock_df, std_check_function),
+    pytest.param(*_shared_param_with_single_field, id="single_field"),
+    pytest.param(two_stock_df, std_check_function, id="two_stocks"),
 ]
 
 
@@ -34,8 +39,9 @@ def test_pipeline_validation_workflow(data, check):
     :return:
     """
     # ii) creating the pipeline
-    check = Check(std_check_function)
-    validation = Validation(check)
+    # Check introspection is cached per function, so building it per case is a lookup. Validation keeps the
+    # results of its runs, so each case gets its own instead of sharing a module scoped one
+    validation = Validation(Check(check))
     df = data()
 
     # iii) Currently running it through pipeline since Pipeline is a little messed up
@@ -59,12 +65,8 @@ def test_pipeline_workflow():
     # Testing new pipeline api
     pipeline = Pipeline()
 
-    pipeline.add_report_set(
-        report=report1, validation=validation
-    )
-
-    pipeline.add_report_set(
-        report=report2, validation=validation
+    pipeline.add_report_sets(
+        reports=[report1, report2], validation=validation
     )
 
     x = pipeline.run_error_log()
@@ -105,3 +107,163 @@ def test_pipeline_workflow_similar_param_name():
 
     y = pipeline.run_error_log()
     print(y)
+
+
+def test_validation_series_function_with_shared_params():
+    """a check typed with pd.Series should get whole columns for every shared parameter set"""
+    validation = Validation(Check(series_check_function))
+    result = validation.run(two_stock_df(), infer_shared=True)
+
+    assert list(result.columns) == ["series_check_function_tsm", "series_check_function_vt"]
+    assert result["series_check_function_tsm"].tolist() == [False, True, False, False, False, False]
+    assert not result["series_check_function_vt"].any()
+
+
+def test_validation_scalar_function_on_whole_columns():
+    """scalar checks that also work on whole columns are called once with the columns, and give the same
+    results as running them per row"""
+    calls = []
+
+    def gross_above_expenses(stock_gross_income: float, stock_expenses: float) -> bool:
+        calls.append((type(stock_gross_income), type(stock_expenses)))
+        return stock_gross_income - stock_expenses > 140
+
+    def gross_above_expenses_per_row(stock_gross_income: float, stock_expenses: float) -> bool:
+        if stock_gross_income - stock_expenses > 140:
+            return True
+        return False
+
+    df = single_stock_df()
+    vectorized = Validation(Check(gross_above_expenses, vectorize=True)).run(df, infer_shared=True)
+    per_row = Validation(Check(gross_above_expenses_per_row, vectorize=True)).run(df, infer_shared=True)
+    assert calls == [(pd.Series, pd.Series)]
+    assert vectorized.iloc[:, 0].tolist() == per_row.iloc[:, 0].tolist()
+
+
+def test_validation_checks_on_threads_keep_order():
+    """running the checks on several threads should give the same columns, in the same order, as one thread"""
+    checks = [Check(std_check_function), Check(series_check_function)]
+    df = two_stock_df()
+
+    in_order = Validation(checks).run(df, infer_shared=True)
+    threaded = Validation(checks).run(df, infer_shared=True, max_workers=2)
+    pd.testing.assert_frame_equal(in_order, threaded)
+
+
+def test_validation_array_function_gets_whole_columns():
+    """a check typed with np.ndarray should be run once on the column arrays and keep the dataframe index"""
+    def gross_above_expenses(stock_gross_income: np.ndarray, stock_expenses: np.ndarray) -> np.ndarray:
+        assert isinstance(stock_gross_income, np.ndarray)
+        return stock_gross_income - stock_expenses > 140
+
+    df = single_stock_df()
+    result = Validation(Check(gross_above_expenses)).run(df, infer_shared=True)
+    expected = (df["tsm_gross_income"] - df["tsm_expenses"] > 140).tolist()
+    assert result["gross_above_expenses"].tolist() == expected
+
+
+def test_validation_scalar_function_gets_timestamps():
+    """row by row checks should get the values the way pandas boxes them, like pd.Timestamp for datetime columns"""
+    def traded_after_2024(traded_on: pd.Timestamp) -> bool:
+        return traded_on.year > 2024
+
+    df = pd.DataFrame({"traded_on": pd.to_datetime(["2024-06-30", "2025-01-02"])})
+    result = Validation(Check(traded_after_2024)).run(df)
+    assert result["traded_after_2024"].tolist() == [False, True]
+
+
+def _gross_above_expenses(stock_gross_income: float, stock_expenses: float) -> bool:
+    return stock_gross_income - stock_expenses > 140
+
+
+def _gross_above_floor(stock_gross_income: float, option=140.0) -> bool:
+    return stock_gross_income > option
+
+
+def _gross_above_expenses_as_decimal(stock_gross_income: float, stock_expenses: float) -> bool:
+    return Decimal(stock_gross_income) - Decimal(stock_expenses) > 140
+
+
+@pytest.mark.parametrize("check_function", [
+    pytest.param(_gross_above_expenses, id="columns_only"),
+    pytest.param(_gross_above_floor, id="default_option"),
+])
+def test_validation_jit_function_matches_per_row(check_function):
+    """checks compiled with numba should give the same results as running them per row. Checks with options
+    left to their defaults run row by row, without a warning"""
+    pytest.importorskip("numba")
+
+    df = single_stock_df()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        compiled = Validation(Check(check_function, jit=True)).run(df, infer_shared=True)
+    per_row = Validation(Check(check_function)).run(df, infer_shared=True)
+    pd.testing.assert_frame_equal(compiled, per_row)
+
+
+def test_validation_jit_function_that_cant_compile():
+    """checks numba can't compile warn, and still give the results of running them per row"""
+    pytest.importorskip("numba")
+
+    df = single_stock_df()
+    with pytest.warns(UserWarning, match="Could not compile `_gross_above_expenses_as_decimal`"):
+        compiled = Validation(Check(_gross_above_expenses_as_decimal, jit=True)).run(df, infer_shared=True)
+    per_row = Validation(Check(_gross_above_expenses)).run(df, infer_shared=True)
+    assert compiled.iloc[:, 0].tolist() == per_row.iloc[:, 0].tolist()
+
+
+def test_validation_check_without_parameters():
+    """a check without parameters is called once per row"""
+    def always_passes() -> bool:
+        return True
+
+    result = Validation(Check(always_passes)).run(single_stock_df())
+    assert result["always_passes"].tolist() == [True] * len(single_stock_df())
+
+
+def test_validation_vectorized_results_keep_their_rows():
+    """whole-column results on a different index are not used, so every result stays on its own row"""
+    def gross_above_expenses(stock_gross_income: float, stock_expenses: float) -> bool:
+        if isinstance(stock_gross_income, pd.Series):
+            return (stock_gross_income - stock_expenses > 140).reset_index(drop=True)
+        return stock_gross_income - stock_expenses > 140
+
+    df = single_stock_df()
+    df.index = df.index[::-1] + 10
+    result = Validation(Check(gross_above_expenses, vectorize=True)).run(df, infer_shared=True)
+    expected = df["tsm_gross_income"] - df["tsm_expenses"] > 140
+    assert result["gross_above_expenses"].to_dict() == expected.to_dict()
+
+
+def test_validation_lets_go_of_replaced_checks():
+    """replacing the checks of a Validation drops what it remembered about the previous checks"""
+    import gc
+    import weakref
+
+    def gross_above_expenses(stock_gross_income: float, stock_expenses: float) -> bool:
+        return stock_gross_income - stock_expenses > 140
+
+    check = Check(gross_above_expenses)
+    validation = Validation(check)
+    validation.run(single_stock_df(), infer_shared=True)
+    check_ref = weakref.ref(check)
+
+    validation.checks_performed = [Check(std_check_function)]
+    del check
+    gc.collect()
+    assert check_ref() is None
+    result = validation.run(single_stock_df(), infer_shared=True)
+    assert "std_check_function" in result.columns
+
+
+def test_validation_jit_function_on_nullable_columns():
+    """checks compiled with numba give the same results as running them per row when a nullable column has NA"""
+    pytest.importorskip("numba")
+
+    df = pd.DataFrame({
+        "stock_gross_income": pd.array([100, 300, None], dtype="Int64"),
+        "stock_expenses": [10.0, 20.0, 30.0],
+    })
+    compiled = Validation(Check(_gross_above_expenses, jit=True)).run(df)
+    per_row = Validation(Check(_gross_above_expenses)).run(df)
+    pd.testing.assert_frame_equal(compiled, per_row)
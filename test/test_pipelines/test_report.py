@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+
+from dirlin.pipeline import Report
+
+
+def test_report_format_cleans_number_strings():
+    """currency signs and thousands separators are dropped, percentages become fractions, missing words become 0"""
+    df = pd.DataFrame({"amount": ["$1,000", "50%", "nan", "none", None, "12.5"]})
+    result = Report(column_type_floats=["amount"]).format(df)
+    assert result["amount"].tolist() == [1000.0, 0.5, 0.0, 0.0, 0.0, 12.5]
+
+
+def test_report_format_keeps_the_index():
+    """cleaned values stay on their rows when the dataframe doesn't have a RangeIndex"""
+    df = pd.DataFrame({"amount": ["$2,500", "25%", "none"], "units": ["1,000", "3", "nan"]}, index=[10, 5, 7])
+    result = Report(column_type_floats=["amount"], column_type_ints=["units"]).format(df)
+
+    assert result.index.tolist() == [10, 5, 7]
+    assert result["amount"].to_dict() == {10: 2500.0, 5: 0.25, 7: 0.0}
+    assert result["units"].to_dict() == {10: 1000, 5: 3, 7: 0}
+
+
+def test_report_format_normalizes_cash_columns():
+    """cash columns take the signature of the key cash column on the same row"""
+    df = pd.DataFrame(
+        {"net": [-10.0, 20.0, -30.0], "fee": [1.0, -2.0, -3.0], "tax": [-4.0, 5.0, 6.0]},
+        index=["c", "a", "b"],
+    )
+    report = Report(column_type_cash=["fee", "tax"], key_cash_column="net")
+    result = report.format(df, normalize_cash_columns=True)
+
+    assert result["fee"].to_dict() == {"c": -1.0, "a": 2.0, "b": -3.0}
+    assert result["tax"].to_dict() == {"c": -4.0, "a": 5.0, "b": -6.0}
+
+
+def test_report_format_normalize_needs_cash_columns():
+    with pytest.raises(ValueError):
+        Report(column_type_cash=["fee"]).format(pd.DataFrame({"fee": [1.0]}), normalize_cash_columns=True)
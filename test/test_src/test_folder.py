@@ -0,0 +1,135 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from dirlin import Folder
+
+
+@pytest.fixture
+def report_folder(tmp_path) -> Folder:
+    """a folder with three small csv reports and one file that isn't a report"""
+    for number in range(1, 4):
+        pd.DataFrame({"id": [number], "amount": [number * 10]}).to_csv(tmp_path / f"r_{number}.csv", index=False)
+    (tmp_path / "notes.txt").write_text("not a report")
+    return Folder(tmp_path)
+
+
+def test_find_and_combine_raises_reader_errors(report_folder):
+    """a bad reader argument should raise, instead of every file being skipped"""
+    for max_workers in (1, 2):
+        with pytest.raises(ValueError):
+            report_folder.find_and_combine("r_", usecols=["nope"], max_workers=max_workers)
+
+
+def test_find_and_combine_skips_unreadable_files_when_asked(report_folder):
+    (report_folder.path / "r_bad.json").write_bytes(b"\xff\xfe not json")
+
+    with pytest.raises(UnicodeDecodeError, match="invalid start byte"):
+        report_folder.find_and_combine("r_")
+    df = report_folder.find_and_combine("r_", errors="skip")
+    assert sorted(df["id"]) == [1, 2, 3]
+
+
+def test_folder_walk_skips_symlinked_folders(report_folder, tmp_path):
+    """a symlink to a folder is neither a file nor walked into"""
+    linked = tmp_path.parent / f"{tmp_path.name}_linked"
+    linked.mkdir()
+    (linked / "r_9.csv").write_text("id,amount\n9,90\n")
+    (tmp_path / "r_link.csv").symlink_to(linked, target_is_directory=True)
+
+    df = report_folder.find_and_combine("r_", recurse=True)
+    assert sorted(df["id"].tolist()) == [1, 2, 3]
+
+
+def test_folder_walk_on_missing_folder_finds_nothing(tmp_path):
+    """a folder that can't be listed gives no files instead of raising"""
+    from dirlin.src.base import _scan_files
+
+    assert list(_scan_files(tmp_path / "missing", "*", recurse=True)) == []
+
+
+def test_folder_listing_cache(report_folder, tmp_path):
+    """searches re-scan by default. With `cache_ttl` set, they reuse the listing until `refresh()`"""
+    (tmp_path / "r_4.csv").write_text("id,amount\n4,40\n")
+    assert len(list(report_folder.iter_files("r_"))) == 4
+
+    cached_folder = Folder(tmp_path, cache_ttl=60)
+    assert len(list(cached_folder.iter_files("r_"))) == 4
+    (tmp_path / "r_5.csv").write_text("id,amount\n5,50\n")
+    assert len(cached_folder.find_and_combine("r_")) == 4
+
+    cached_folder.refresh()
+    assert len(cached_folder.find_and_combine("r_")) == 5
+
+
+def _set_ages(folder: Folder, seconds_old: dict[str, float]) -> None:
+    """sets the modified time of each file to `seconds_old` seconds ago"""
+    now = time.time()
+    for name, seconds in seconds_old.items():
+        os.utime(folder.path / name, (now - seconds, now - seconds))
+
+
+def test_open_many_keeps_order_and_urls(report_folder, monkeypatch):
+    """open_many returns the frames in the order of `paths`, and urls reach `open()` unchanged"""
+    opened_urls = []
+
+    def _open_url(url, *args, **kwargs):
+        opened_urls.append(url)
+        return pd.DataFrame({"id": [9], "amount": [90]})
+
+    monkeypatch.setattr(Folder, "_open_url", staticmethod(_open_url))
+    url = "https://docs.google.com/spreadsheets/d/abc/export?format=csv"
+    for max_workers in (1, 2):
+        frames = report_folder.open_many(["r_3.csv", report_folder.path / "r_1.csv", url], max_workers=max_workers)
+        assert [frame["id"].iloc[0] for frame in frames] == [3, 1, 9]
+        assert [frame["From"].iloc[0] for frame in frames] == ["r_3", "r_1", url]
+    assert opened_urls == [url, url]
+
+
+def test_find_and_combine_days_and_only_first_x(report_folder):
+    """days leaves out files modified before the window, only_first_x keeps the newest files first"""
+    _set_ages(report_folder, {"r_1.csv": 10 * 86400, "r_2.csv": 60, "r_3.csv": 0})
+
+    assert sorted(report_folder.find_and_combine("r_", days=5)["id"]) == [2, 3]
+    assert report_folder.find_and_combine("r_", only_first_x=2)["id"].tolist() == [3, 2]
+
+
+def test_find_and_combine_with_duckdb(report_folder):
+    """the duckdb reader should give the same rows as pandas, newest files first"""
+    pytest.importorskip("duckdb")
+    _set_ages(report_folder, {"r_1.csv": 120, "r_2.csv": 60, "r_3.csv": 0})
+
+    df = report_folder.find_and_combine("r_", use_duckdb=True)
+    assert df["id"].tolist() == [3, 2, 1]
+    assert df["From"].tolist() == ["r_3", "r_2", "r_1"]
+    assert df["id"].tolist() == report_folder.find_and_combine("r_")["id"].tolist()
+
+
+def test_folder_patterns_with_a_sub_folder(report_folder, tmp_path):
+    """a pattern with a folder part searches that folder, and with recurse, folders of that name at any depth"""
+    (tmp_path / "sub" / "deep" / "sub").mkdir(parents=True)
+    (tmp_path / "sub" / "r_4.csv").write_text("id,amount\n4,40\n")
+    (tmp_path / "sub" / "deep" / "sub" / "r_5.csv").write_text("id,amount\n5,50\n")
+
+    assert report_folder.find_and_combine("sub/r_")["id"].tolist() == [4]
+    assert sorted(report_folder.find_and_combine("sub/r_", recurse=True)["id"]) == [4, 5]
+    assert report_folder.index_files(".csv", "sub/r_*") == [tmp_path / "sub" / "r_4.csv"]
+
+
+def test_open_recent_in_sub_folders_and_hidden_files(report_folder, tmp_path):
+    """open_recent finds files through a sub-folder pattern, and only skips temporary (`~`) files"""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "r_4.csv").write_text("id,amount\n4,40\n")
+    (tmp_path / ".hid_r.csv").write_text("id,amount\n5,50\n")
+    (tmp_path / "~$r_6.csv").write_text("id,amount\n6,60\n")
+
+    assert report_folder.open_recent("sub/r_")["id"].tolist() == [4]
+    assert report_folder.open_recent("sub/r_4.csv", with_asterisks=False)["id"].tolist() == [4]
+    assert report_folder.open_recent(".hid")["id"].tolist() == [5]
+    assert report_folder.open_recent(".hid_r.csv", with_asterisks=False)["id"].tolist() == [5]
+    with pytest.raises(FileNotFoundError):
+        report_folder.open_recent("~")
+    # find_and_combine keeps skipping hidden files
+    assert report_folder.find_and_combine(".hid") is None